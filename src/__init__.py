@@ -0,0 +1,24 @@
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .api import Boundaries, simplify_features, simplify_geometries, simplify_geometry, split_features
+    from .shapefile_io import read_shapefile
+
+# Public name -> module defining it, imported on first access.
+_EXPORTS = {
+    "Boundaries": "api",
+    "simplify_features": "api",
+    "simplify_geometries": "api",
+    "simplify_geometry": "api",
+    "split_features": "api",
+    "read_shapefile": "shapefile_io",
+}
+
+__all__ = ["Boundaries", "read_shapefile", "simplify_features", "simplify_geometries", "simplify_geometry", "split_features"]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
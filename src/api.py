@@ -0,0 +1,163 @@
+import itertools
+import numpy as np
+import shapely
+from shapely.geometry import mapping, shape
+from .instrumentation import Stats
+
+# Number of features converted to geometries and tested together by `split_features`.
+SPLIT_CHUNK_SIZE = 10_000
+
+
+class Boundaries:
+    """
+    Named boundary polygons (e.g. states) with a spatial index.
+
+    Build it once and reuse it across calls to `split_features` to avoid parsing the boundaries and building the index each time.
+    """
+
+    def __init__(self, names, geometries):
+        self.names = list(names)
+        self.geometries = np.array(list(geometries), dtype=object)
+
+        if len(self.names) != len(self.geometries):
+            raise ValueError(f"Got {len(self.names)} names for {len(self.geometries)} geometries")
+
+        self._tree = shapely.STRtree(self.geometries)
+
+    @classmethod
+    def from_features(cls, features, name_field):
+        """
+        Build the boundaries from GeoJSON features, named after the `name_field` property.
+
+        Features without geometry are skipped. If two features share a name, the last one wins.
+        """
+        geometries = {}
+        for feature in features:
+            if feature["geometry"] is None:
+                continue
+            try:
+                name = feature["properties"][name_field]
+            except KeyError as exc:
+                raise KeyError(f"`{name_field}` not found in properties: {feature['properties'].keys()}") from exc
+            geometries[name] = shape(feature["geometry"])
+
+        return cls(geometries.keys(), geometries.values())
+
+    def __len__(self):
+        return len(self.names)
+
+    def query(self, geometries, stats=None):
+        """
+        Find the boundaries intersecting each geometry of an array.
+
+        Returns a (2, n) array of (geometry index, boundary index) pairs, sorted by geometry and then by boundary order.
+        Candidates are pre-selected with the spatial index and only those are tested with the exact predicate.
+        """
+        stats = stats or Stats()
+        geometries = np.asarray(geometries, dtype=object)
+
+        candidates = self._tree.query(geometries)
+        hits = candidates[:, shapely.intersects(geometries[candidates[0]], self.geometries[candidates[1]])]
+        stats.count("candidates", candidates.shape[1])
+        stats.count("hits", hits.shape[1])
+
+        return hits[:, np.lexsort((hits[1], hits[0]))]
+
+
+def split_features(features, boundaries, stats=None):
+    """
+    Group GeoJSON features by the boundaries they intersect.
+
+    A feature intersecting several boundaries is added to each of them. Features without geometry are ignored.
+
+    Args:
+        features: Iterable of GeoJSON features. It is consumed in chunks, so it can be a generator.
+        boundaries: `Boundaries` to split by.
+        stats: Optional `Stats` to record timers and counters into.
+
+    Returns:
+        Dict of boundary name to list of features, in input order.
+    """
+    stats = stats or Stats()
+    boundary_features = {}
+
+    features = iter(features)
+    while chunk := list(itertools.islice(features, SPLIT_CHUNK_SIZE)):
+        with stats.stage("geometry"):
+            geometries = np.array([shape(feature["geometry"]) if feature["geometry"] else None for feature in chunk], dtype=object)
+        stats.count("features", len(chunk))
+        stats.count("vertices", int(shapely.get_num_coordinates(geometries).sum()))
+
+        with stats.stage("predicates"):
+            feature_indices, boundary_indices = boundaries.query(geometries, stats)
+
+        for feature_index, boundary_index in zip(feature_indices.tolist(), boundary_indices.tolist(), strict=True):
+            boundary_features.setdefault(boundaries.names[boundary_index], []).append(chunk[feature_index])
+
+    return boundary_features
+
+
+def _exterior_points(geometry):
+    """Number of points in the exterior rings of a Polygon or MultiPolygon."""
+    polygons = geometry.geoms if geometry.geom_type == "MultiPolygon" else [geometry]
+    return sum(len(polygon.exterior.coords) for polygon in polygons)
+
+
+def simplify_geometry(geometry, tolerance):
+    """
+    Simplify a Polygon or MultiPolygon with the Douglas-Peucker algorithm.
+
+    A MultiPolygon is simplified as a whole, so its parts do not end up overlapping. This gives the same result as `simplify_geometries`.
+
+    Returns the simplified geometry with the number of exterior points before and after, or None for other geometry types.
+    """
+    if geometry.geom_type not in ("Polygon", "MultiPolygon"):
+        return None
+
+    simplified = shapely.simplify(geometry, tolerance)
+
+    return simplified, _exterior_points(geometry), _exterior_points(simplified)
+
+
+def simplify_geometries(geometries, tolerance):
+    """Simplify the Polygons and MultiPolygons of a geometry array, like `simplify_geometry`. Other geometries are returned unchanged."""
+    geometries = np.array(geometries, dtype=object)
+    polygonal = np.isin(shapely.get_type_id(geometries), [shapely.GeometryType.POLYGON, shapely.GeometryType.MULTIPOLYGON])
+    geometries[polygonal] = shapely.simplify(geometries[polygonal], tolerance)
+
+    return geometries
+
+
+def simplify_features(features, tolerance, stats=None, on_simplified=None):
+    """
+    Simplify the Polygon and MultiPolygon geometries of GeoJSON features.
+
+    The features are updated in place and yielded as they are processed, so any iterable of features can be streamed through.
+
+    Args:
+        features: Iterable of GeoJSON features.
+        tolerance: Simplification tolerance, in the units of the coordinates.
+        stats: Optional `Stats` to record timers and counters into.
+        on_simplified: Optional callback called with the feature index and the exterior points before and after for each simplified feature.
+    """
+    stats = stats or Stats()
+
+    for index, feature in enumerate(features):
+        stats.count("features")
+        if feature["geometry"] is not None:
+            with stats.stage("geometry"):
+                geometry = shape(feature["geometry"])
+
+            with stats.stage("simplification"):
+                result = simplify_geometry(geometry, tolerance)
+
+            if result is not None:
+                simplified, points_before, points_after = result
+                with stats.stage("geometry"):
+                    feature["geometry"] = mapping(simplified)
+                stats.count("vertices", int(shapely.get_num_coordinates(geometry)))
+                stats.count("vertices_simplified", int(shapely.get_num_coordinates(simplified)))
+                if on_simplified:
+                    on_simplified(index, points_before, points_after)
+
+        yield feature
@@ -0,0 +1,170 @@
+import json
+import math
+import os
+import random
+import tempfile
+import zipfile
+import fiona
+from fiona.crs import CRS  # pylint:disable=no-name-in-module
+
+# Bounding box (min_x, min_y, max_x, max_y) used for every synthetic dataset.
+DEFAULT_BOUNDS = (-125.0, 24.0, -66.0, 50.0)
+
+
+def _write_feature_collection(output_path, features):
+    """Stream features into a GeoJSON FeatureCollection without holding them all in memory."""
+    count = 0
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write('{"type": "FeatureCollection", "features": [\n')
+        for feature in features:
+            if count:
+                f.write(",\n")
+            f.write(json.dumps(feature))
+            count += 1
+        f.write("\n]}\n")
+
+    return count
+
+
+def _iter_points(count, seed, bounds):
+    """Yield reproducible random Point features within the bounds."""
+    rng = random.Random(seed)
+    min_x, min_y, max_x, max_y = bounds
+
+    for index in range(count):
+        yield {
+            "type": "Feature",
+            "properties": {"id": str(index)},
+            "geometry": {"type": "Point", "coordinates": [rng.uniform(min_x, max_x), rng.uniform(min_y, max_y)]},
+        }
+
+
+def _detailed_ring(rng, center_x, center_y, radius, vertices):
+    """Build a closed, star-shaped ring with jittered radii around a centre."""
+    ring = []
+    for step in range(vertices):
+        angle = 2 * math.pi * step / vertices
+        distance = radius * rng.uniform(0.7, 1.0)
+        ring.append([center_x + distance * math.cos(angle), center_y + distance * math.sin(angle)])
+    ring.append(ring[0])
+
+    return ring
+
+
+def _iter_detailed_polygons(count, seed, bounds, vertices):
+    """Yield reproducible Polygon and MultiPolygon features with many vertices each."""
+    rng = random.Random(seed)
+    min_x, min_y, max_x, max_y = bounds
+    radius = min(max_x - min_x, max_y - min_y) / 100
+
+    for index in range(count):
+        center_x = rng.uniform(min_x + radius, max_x - radius)
+        center_y = rng.uniform(min_y + radius, max_y - radius)
+
+        if index % 4 == 3:
+            geometry = {
+                "type": "MultiPolygon",
+                "coordinates": [
+                    [_detailed_ring(rng, center_x, center_y, radius / 2, vertices // 2)],
+                    [_detailed_ring(rng, center_x + radius, center_y, radius / 2, vertices // 2)],
+                ],
+            }
+        else:
+            geometry = {"type": "Polygon", "coordinates": [_detailed_ring(rng, center_x, center_y, radius, vertices)]}
+
+        yield {"type": "Feature", "properties": {"id": str(index)}, "geometry": geometry}
+
+
+def _densify_edge(start, end, vertices_per_edge):
+    """Return the points of an edge from start (inclusive) to end (exclusive)."""
+    return [
+        [start[0] + (end[0] - start[0]) * step / vertices_per_edge, start[1] + (end[1] - start[1]) * step / vertices_per_edge]
+        for step in range(vertices_per_edge)
+    ]
+
+
+def _rectangle_ring(left, bottom, right, top, vertices_per_edge):
+    """Build a closed rectangular ring with `vertices_per_edge` points on each side."""
+    corners = [[left, bottom], [right, bottom], [right, top], [left, top]]
+    ring = []
+    for corner_index, corner in enumerate(corners):
+        ring.extend(_densify_edge(corner, corners[(corner_index + 1) % 4], vertices_per_edge))
+    ring.append(ring[0])
+
+    return ring
+
+
+def _iter_coverage_cells(regions, bounds):
+    """
+    Yield (left, bottom, right, top) rectangles that exactly tile the bounds.
+
+    The cells are laid out in rows, with the remainder spread across the first rows so that exactly `regions` cells are produced.
+    """
+    min_x, min_y, max_x, max_y = bounds
+    rows = max(1, math.isqrt(regions))
+    row_height = (max_y - min_y) / rows
+
+    for row in range(rows):
+        columns = regions // rows + (1 if row < regions % rows else 0)
+        column_width = (max_x - min_x) / columns
+        bottom = min_y + row * row_height
+
+        for column in range(columns):
+            left = min_x + column * column_width
+            yield left, bottom, left + column_width, bottom + row_height
+
+
+def _iter_coverage_regions(regions, bounds, vertices_per_edge, name_field):
+    """Yield rectangular regions that exactly tile the bounds, like a states/boundaries layer."""
+    for index, cell in enumerate(_iter_coverage_cells(regions, bounds)):
+        yield {
+            "type": "Feature",
+            "properties": {name_field: f"Region_{index}"},
+            "geometry": {"type": "Polygon", "coordinates": [_rectangle_ring(*cell, vertices_per_edge)]},
+        }
+
+
+def generate_point_cloud(output_path, count, seed=0, bounds=DEFAULT_BOUNDS):
+    """Write a GeoJSON file with `count` random points. Returns the number of features written."""
+    return _write_feature_collection(output_path, _iter_points(count, seed, bounds))
+
+
+def generate_detailed_polygons(output_path, count, seed=0, vertices=64, bounds=DEFAULT_BOUNDS):
+    """Write a GeoJSON file with `count` polygons of roughly `vertices` points each. Returns the number of features written."""
+    return _write_feature_collection(output_path, _iter_detailed_polygons(count, seed, bounds, vertices))
+
+
+def generate_boundary_coverage(output_path, regions=50, vertices_per_edge=25, name_field="STATE_NAME", bounds=DEFAULT_BOUNDS):
+    """
+    Write a GeoJSON coverage of `regions` non-overlapping polygons that tile the bounds.
+
+    Args:
+        output_path: Path to the GeoJSON file to create.
+        regions: Number of regions in the coverage, typically between 50 and 3,000.
+        vertices_per_edge: Number of vertices on each side of a region, to mimic detailed borders.
+        name_field: Property holding the region name.
+        bounds: Bounding box covered by the regions.
+    """
+    if regions < 1:
+        raise ValueError(f"A coverage needs at least one region, got {regions}")
+
+    return _write_feature_collection(output_path, _iter_coverage_regions(regions, bounds, vertices_per_edge, name_field))
+
+
+def generate_zipped_shapefile(output_zip_path, count, seed=0, bounds=DEFAULT_BOUNDS):
+    """Write a zipped point shapefile with `count` random points. Returns the number of features written."""
+    schema = {"geometry": "Point", "properties": {"id": "int"}}
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        shp_path = os.path.join(tmpdir, "points.shp")
+
+        with fiona.open(shp_path, "w", driver="ESRI Shapefile", crs=CRS.from_epsg(4326).to_string(), schema=schema) as shapefile:
+            shapefile.writerecords(
+                {"geometry": feature["geometry"], "properties": {"id": int(feature["properties"]["id"])}} for feature in _iter_points(count, seed, bounds)
+            )
+
+        with zipfile.ZipFile(output_zip_path, "w", zipfile.ZIP_DEFLATED) as zip_ref:
+            for filename in sorted(os.listdir(tmpdir)):
+                zip_ref.write(os.path.join(tmpdir, filename), filename)
+
+    return count
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+import contextlib
+import json
+import multiprocessing
+import os
+import platform
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime
+import click
+import fiona
+import shapely
+from ..geojson_simplify import _geojson_simplify
+from ..instrumentation import peak_rss_mb
+from ..shp2geojson import _shapefile_to_geojson
+from ..split_by_states import split_geojson_by_state
+from .datasets import generate_boundary_coverage, generate_detailed_polygons, generate_point_cloud, generate_zipped_shapefile
+
+SCALES = {"10k": 10_000, "1m": 1_000_000, "10m": 10_000_000}
+CASES = ("split_geojson_by_state", "geojson_simplify", "shapefile_to_geojson")
+METRICS = ("wall_time_s", "peak_rss_mb")
+# Vertices per polygon of the `geojson_simplify` dataset, by maximum number of features.
+# Fewer vertices at the larger scales keep the files in the GB range instead of tens of GB.
+SIMPLIFY_VERTICES = ((10_000, 64), (1_000_000, 16))
+SIMPLIFY_MIN_VERTICES = 8
+
+
+def simplify_vertices(features):
+    """Vertices per polygon used by the `geojson_simplify` dataset for the given number of features."""
+    return next((vertices for max_features, vertices in SIMPLIFY_VERTICES if features <= max_features), SIMPLIFY_MIN_VERTICES)
+
+
+def _prepare_datasets(case, features, data_dir, seed, regions):
+    """Generate (or reuse) the input files needed by a case. Returns the paths keyed by role."""
+    os.makedirs(data_dir, exist_ok=True)
+
+    def _cached(filename, generator):
+        path = os.path.join(data_dir, filename)
+        if not os.path.exists(path):
+            tmp_path = f"{path}.partial"
+            generator(tmp_path)
+            os.replace(tmp_path, path)
+        return path
+
+    if case == "split_geojson_by_state":
+        return {
+            "states": _cached(f"coverage_{regions}.geojson", lambda path: generate_boundary_coverage(path, regions=regions)),
+            "input": _cached(f"points_{features}_{seed}.geojson", lambda path: generate_point_cloud(path, features, seed=seed)),
+        }
+    if case == "geojson_simplify":
+        vertices = simplify_vertices(features)
+        return {
+            "input": _cached(
+                f"polygons_{features}_{vertices}_{seed}.geojson",
+                lambda path: generate_detailed_polygons(path, features, seed=seed, vertices=vertices),
+            )
+        }
+    if case == "shapefile_to_geojson":
+        return {"input": _cached(f"points_{features}_{seed}.zip", lambda path: generate_zipped_shapefile(path, features, seed=seed))}
+
+    raise ValueError(f"Unknown benchmark case: {case}")
+
+
+def _run_case_in_process(case, paths, work_dir):
+    """Run a single case in the current process and measure it. Meant to be executed in a fresh child process."""
+    output_path = os.path.join(work_dir, "output.geojson")
+
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        if case == "split_geojson_by_state":
+            split_geojson_by_state(paths["states"], paths["input"], os.path.join(work_dir, "split"), "STATE_NAME")
+        elif case == "geojson_simplify":
+            _geojson_simplify(paths["input"], output_path, 0.001)
+        elif case == "shapefile_to_geojson":
+            _shapefile_to_geojson(paths["input"], output_path)
+        else:
+            raise ValueError(f"Unknown benchmark case: {case}")
+        wall_time = time.perf_counter() - start
+
+    return wall_time, peak_rss_mb()
+
+
+def run_case(case, features, data_dir, seed=0, regions=50):
+    """
+    Time one benchmark case on a synthetic dataset.
+
+    The case runs in a freshly spawned interpreter so that the peak RSS is not polluted by earlier cases or by dataset generation.
+
+    Args:
+        case: One of `CASES`.
+        features: Number of features in the input dataset.
+        data_dir: Directory where generated datasets are cached between runs.
+        seed: Seed for the random dataset generator.
+        regions: Number of regions in the boundary coverage used by `split_geojson_by_state`.
+    """
+    paths = _prepare_datasets(case, features, data_dir, seed, regions)
+
+    with tempfile.TemporaryDirectory() as work_dir, ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        wall_time, peak_rss = executor.submit(_run_case_in_process, case, paths, work_dir).result()
+
+    result = {
+        "case": case,
+        "features": features,
+        "wall_time_s": round(wall_time, 4),
+        "throughput_fps": round(features / wall_time, 2) if wall_time else None,
+        "peak_rss_mb": round(peak_rss, 2),
+    }
+    if case == "split_geojson_by_state":
+        result["regions"] = regions
+    elif case == "geojson_simplify":
+        result["vertices"] = simplify_vertices(features)
+
+    return result
+
+
+def _result_key(result):
+    return result["case"], result["features"], result.get("regions"), result.get("vertices")
+
+
+def compare_results(results, baseline, threshold=0.2):
+    """
+    Compare benchmark results against a baseline.
+
+    Returns a list of human-readable regressions: every metric that is more than `threshold` (a fraction) worse than the baseline.
+    Cases missing from the baseline are ignored.
+    """
+    baseline_by_key = {_result_key(result): result for result in baseline["results"]}
+    regressions = []
+
+    for result in results["results"]:
+        reference = baseline_by_key.get(_result_key(result))
+        if reference is None:
+            continue
+
+        for metric in METRICS:
+            if not reference.get(metric):
+                continue
+            ratio = result[metric] / reference[metric]
+            if ratio > 1 + threshold:
+                regressions.append(f"{result['case']} ({result['features']} features): {metric} {reference[metric]} -> {result[metric]} ({ratio:.2f}x)")
+
+    return regressions
+
+
+def run_benchmarks(scales, cases=CASES, data_dir=None, seed=0, regions=50):
+    """Run every case at every scale and return the results document."""
+    data_dir = data_dir or os.path.join(tempfile.gettempdir(), "gis_utils_benchmarks")
+    results = []
+
+    for scale in scales:
+        features = SCALES[scale] if isinstance(scale, str) else scale
+        for case in cases:
+            result = run_case(case, features, data_dir, seed=seed, regions=regions)
+            click.echo(
+                f"{case} ({features} features): {result['wall_time_s']}s, {result['throughput_fps']} features/s, {result['peak_rss_mb']} MiB peak RSS",
+                err=True,
+            )
+            results.append(result)
+
+    return {
+        "metadata": {
+            "created_at": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "shapely": shapely.__version__,
+            "fiona": fiona.__version__,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+@click.command("gis-benchmark")
+@click.option(
+    "--scale",
+    "scales",
+    multiple=True,
+    type=click.Choice(list(SCALES)),
+    default=["10k"],
+    show_default=True,
+    help="Dataset scale, can be repeated. The tools load whole files in memory: 1m needs a few GB of RAM and 10m tens of GB.",
+)
+@click.option("--case", "cases", multiple=True, type=click.Choice(CASES), default=CASES, help="Case to run, can be repeated. Defaults to all.")
+@click.option("--regions", default=50, type=click.IntRange(1), show_default=True, help="Number of regions in the boundary coverage.")
+@click.option("--seed", default=0, type=int, show_default=True, help="Seed for the synthetic dataset generator.")
+@click.option("--data-dir", type=click.Path(file_okay=False), help="Directory to cache the generated datasets.")
+@click.option("--output", type=click.Path(dir_okay=False), help="Path to save the JSON results. Printed to stdout if not provided.")
+@click.option("--baseline", type=click.Path(exists=True, dir_okay=False), help="JSON results to compare against.")
+@click.option("--threshold", default=0.2, type=float, show_default=True, help="Allowed slowdown as a fraction of the baseline.")
+def main(scales, cases, regions, seed, data_dir, output, baseline, threshold):
+    """
+    Benchmark the GIS utilities on reproducible synthetic datasets.
+    """
+    results = run_benchmarks(scales, cases=cases, data_dir=data_dir, seed=seed, regions=regions)
+
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    else:
+        click.echo(json.dumps(results, indent=2))
+
+    if baseline:
+        with open(baseline, encoding="utf-8") as f:
+            regressions = compare_results(results, json.load(f), threshold)
+
+        if regressions:
+            raise click.ClickException("Performance regressions found:\n" + "\n".join(regressions))
+        click.echo("No regressions against the baseline.", err=True)
+
+
+if __name__ == "__main__":
+    main()  # pylint:disable=no-value-for-parameter
@@ -2,45 +2,30 @@
 import gzip
 import json
 import os
+import sys
 import tempfile
 import zipfile
+from pathlib import Path
 import click
-from shapely import simplify
-from shapely.geometry import mapping, shape
-from shapely.geometry.multipolygon import MultiPolygon
 
+if __name__ == "__main__" and not __package__:
+    # Run as a script (`python src/geojson_simplify.py`): make the relative imports resolve against the `src` package.
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    __package__ = "src"  # pylint: disable=redefined-builtin
 
-def _simplify_polygon(polygon, tolerance):
-    """Simplifies a Polygon and returns the point counts."""
-    points_before = len(polygon.exterior.coords)
-    simplified_polygon = simplify(polygon, tolerance)
-    points_after = len(simplified_polygon.exterior.coords)
+from .instrumentation import Stats, instrumented
 
-    return mapping(simplified_polygon), points_before, points_after
 
-
-def _simplify_multipolygon(multipolygon, tolerance):
-    """Simplifies a MultiPolygon and returns the point counts."""
-    simplified_polygons = []
-    points_before = 0
-    points_after = 0
-
-    for polygon in multipolygon.geoms:
-        points_before += len(polygon.exterior.coords)
-        simplified_polygon = simplify(polygon, tolerance)
-        points_after += len(simplified_polygon.exterior.coords)
-        simplified_polygons.append(simplified_polygon)
-
-    return mapping(MultiPolygon(simplified_polygons)), points_before, points_after
-
-
-def _geojson_simplify(input_path, output_geojson_path, tolerance):
+def _geojson_simplify(input_path, output_geojson_path, tolerance, stats=None):
     """
     Simplify polygons in a GeoJSON file or a zip file containing a geojson.
 
     INPUT_PATH: Path to the input GeoJSON file or zip file.
     OUTPUT_GEOJSON_PATH: Path to the output GeoJSON file.
+    STATS: Optional `Stats` to record timers and counters into.
     """
+    stats = stats or Stats()
+
     if zipfile.is_zipfile(input_path):
         with tempfile.TemporaryDirectory() as tmpdir, zipfile.ZipFile(input_path) as zip_ref:
             geojson_filename = None
@@ -52,9 +37,10 @@ def _geojson_simplify(input_path, output_geojson_path, tolerance):
             if geojson_filename is None:
                 raise ValueError(f"No GeoJSON file found in the zip archive: {input_path}")
 
-            zip_ref.extract(geojson_filename, tmpdir)
+            with stats.stage("decompress"):
+                zip_ref.extract(geojson_filename, tmpdir)
             input_geojson_path = os.path.join(tmpdir, geojson_filename)
-            _process_geojson_file(input_geojson_path, output_geojson_path, tolerance, input_path)
+            _process_geojson_file(input_geojson_path, output_geojson_path, tolerance, input_path, stats)
     elif input_path.lower().endswith(".gz"):
         with (
             tempfile.TemporaryDirectory() as tmpdir,
@@ -63,17 +49,18 @@ def _geojson_simplify(input_path, output_geojson_path, tolerance):
             decompressed_filename = temp_decompressed_file.name
 
             # Decompress the .gz file and write to the temporary file
-            with gzip.open(input_path, "rb") as gz_file:
+            with stats.stage("decompress"), gzip.open(input_path, "rb") as gz_file:
                 temp_decompressed_file.write(gz_file.read())  # type: ignore
 
             input_geojson_path = os.path.join(tmpdir, decompressed_filename)
-            _process_geojson_file(input_geojson_path, output_geojson_path, tolerance, input_path)
+            _process_geojson_file(input_geojson_path, output_geojson_path, tolerance, input_path, stats)
     else:
-        _process_geojson_file(input_path, output_geojson_path, tolerance, input_path)
+        _process_geojson_file(input_path, output_geojson_path, tolerance, input_path, stats)
 
 
-def _process_geojson_file(input_geojson_path, output_geojson_path, tolerance, original_input_path):
+def _process_geojson_file(input_geojson_path, output_geojson_path, tolerance, original_input_path, stats):
     """Process the geojson file and saves the simplified version"""
+    from .api import simplify_features  # pylint: disable=import-outside-toplevel
 
     def _get_unique_output_path(base_path):
         """Appends numbers to the output path to make it unique"""
@@ -87,24 +74,14 @@ def _process_geojson_file(input_geojson_path, output_geojson_path, tolerance, or
                 return new_path
             counter += 1
 
-    with open(input_geojson_path, encoding="utf-8") as f:
+    with stats.stage("parse"), open(input_geojson_path, encoding="utf-8") as f:
         geojson_data = json.load(f)
 
-    for index, feature in enumerate(geojson_data["features"]):
-        if feature["geometry"] is None:
-            continue
-
-        original_geom = shape(feature["geometry"])
-
-        if original_geom.geom_type == "Polygon":
-            feature["geometry"], points_before, points_after = _simplify_polygon(original_geom, tolerance)
-        elif original_geom.geom_type == "MultiPolygon":
-            feature["geometry"], points_before, points_after = _simplify_multipolygon(original_geom, tolerance)
-        else:
-            continue
-
+    def _echo_points(index, points_before, points_after):
         click.echo(f"Feature {index}: Points before {points_before}, points after {points_after}")
 
+    geojson_data["features"] = list(simplify_features(geojson_data["features"], tolerance, stats, on_simplified=_echo_points))
+
     if not output_geojson_path:
         if zipfile.is_zipfile(original_input_path):
             filepath, _ = original_input_path.rsplit(".", 1)
@@ -114,7 +91,7 @@ def _process_geojson_file(input_geojson_path, output_geojson_path, tolerance, or
         extension = original_input_path.rsplit(".", 1)[1] if original_input_path.lower().endswith(".geojson") else "json"
         output_geojson_path = _get_unique_output_path(f"{filepath}_simplified.{extension}")
 
-    with open(output_geojson_path, "w", encoding="utf-8") as f:
+    with stats.stage("serialization"), open(output_geojson_path, "w", encoding="utf-8") as f:
         json.dump(geojson_data, f, indent=2)
 
     click.echo(f"Input: {original_input_path}. Output: {output_geojson_path}.")
@@ -129,8 +106,9 @@ def _process_geojson_file(input_geojson_path, output_geojson_path, tolerance, or
     type=float,
     help="Simplification tolerance (in degrees for lat/long).",
 )
-def geojson_simplify(input_path, output_geojson_path, tolerance):
-    _geojson_simplify(input_path, output_geojson_path, tolerance)
+@instrumented
+def geojson_simplify(input_path, output_geojson_path, tolerance, stats):
+    _geojson_simplify(input_path, output_geojson_path, tolerance, stats)
 
 
 if __name__ == "__main__":
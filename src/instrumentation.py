@@ -0,0 +1,118 @@
+import cProfile
+import functools
+import json
+import resource
+import sys
+import time
+from contextlib import contextmanager
+import click
+
+
+def peak_rss_mb():
+    """Peak resident set size of the current process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def count_vertices(geometry):
+    """Count the vertices of a GeoJSON geometry dict."""
+    if geometry is None:
+        return 0
+    if geometry["type"] == "GeometryCollection":
+        return sum(count_vertices(member) for member in geometry["geometries"])
+
+    def _count(coordinates):
+        if not coordinates or isinstance(coordinates[0], (int, float)):
+            return 1 if coordinates else 0
+        return sum(_count(member) for member in coordinates)
+
+    return _count(geometry["coordinates"])
+
+
+class Stats:
+    """
+    Collects per-stage timers and counters for a single run.
+
+    Stages are accumulated, so the same stage can be entered many times (e.g. once per feature).
+    The `features` counter is used for the throughput and the `candidates`/`hits` counters for the spatial test hit ratio.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.counters = {}
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name):
+        """Time the enclosed block and add it to the `name` stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+
+    def count(self, name, value=1):
+        """Add `value` to the `name` counter."""
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def report(self):
+        """Return the collected statistics as a JSON serialisable dict."""
+        total_time = time.perf_counter() - self._start
+        features = self.counters.get("features", 0)
+        candidates = self.counters.get("candidates", 0)
+
+        return {
+            "total_time_s": round(total_time, 6),
+            "stages": {name: round(elapsed, 6) for name, elapsed in self.stages.items()},
+            "counters": dict(self.counters),
+            "features_per_s": round(features / total_time, 2) if total_time else None,
+            "hit_ratio": round(self.counters.get("hits", 0) / candidates, 6) if candidates else None,
+            "peak_rss_mb": round(peak_rss_mb(), 2),
+        }
+
+
+def _format_report(report, stats_format):
+    """Render a report as JSON or as human-readable text."""
+    if stats_format == "json":
+        return json.dumps(report, indent=2)
+
+    lines = [f"Total time: {report['total_time_s']:.3f}s"]
+    lines.extend(f"  {name}: {elapsed:.3f}s" for name, elapsed in report["stages"].items())
+    lines.extend(f"{name}: {value}" for name, value in report["counters"].items())
+    lines.append(f"Features/s: {report['features_per_s']}")
+    if report["hit_ratio"] is not None:
+        lines.append(f"Hit ratio: {report['hit_ratio']}")
+    lines.append(f"Peak RSS: {report['peak_rss_mb']} MiB")
+
+    return "\n".join(lines)
+
+
+def instrumented(func):
+    """
+    Add the `--stats` and `--profile` options to a click command.
+
+    The decorated function receives a `stats` keyword argument with the `Stats` to record into.
+    The report is written to stderr so that it does not mix with the command output.
+    Must be placed below the click decorators.
+    """
+
+    @click.option("--stats", "stats_format", type=click.Choice(["text", "json"]), default=None, help="Print run statistics to stderr.")
+    @click.option("--profile", "profile_path", type=click.Path(dir_okay=False), default=None, help="Write a cProfile dump of the run to this path.")
+    @functools.wraps(func)
+    def wrapper(*args, stats_format, profile_path, **kwargs):
+        stats = Stats()
+        profiler = cProfile.Profile() if profile_path else None
+
+        try:
+            if profiler:
+                profiler.enable()
+            return func(*args, stats=stats, **kwargs)
+        finally:
+            if profiler:
+                profiler.disable()
+                profiler.dump_stats(profile_path)
+            if stats_format:
+                click.echo(_format_report(stats.report(), stats_format), err=True)
+
+    return wrapper
@@ -0,0 +1,66 @@
+import shutil
+import tempfile
+import warnings
+import zipfile
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+import fiona
+from fiona.model import to_dict
+from .instrumentation import Stats, count_vertices
+
+
+@contextmanager
+def temp_extract_dir(input_zip_file):
+    """Context manager for creating and cleaning up a temporary directory."""
+    # A unique directory per call, so that concurrent conversions in the same process do not clash.
+    temp_dir = Path(tempfile.mkdtemp(prefix="temp_shp_extract_"))
+    try:
+        with zipfile.ZipFile(input_zip_file, "r") as zip_ref:
+            zip_ref.extractall(temp_dir)
+        yield temp_dir
+    finally:
+        try:
+            shutil.rmtree(temp_dir)
+        except OSError as exc:
+            warnings.warn(f"Could not remove temporary directory {temp_dir} due to: {exc}", stacklevel=2)
+
+
+def read_shapefile(input_zip_file, stats=None):
+    """
+    Read the features of a zipped shapefile as plain GeoJSON dicts.
+
+    The zip must include the `.shp`, `.shx` and `.dbf` files. The features are yielded one by one.
+    The shapefile is extracted to a temporary directory that is removed once the generator is exhausted or closed,
+    so close it (or use `contextlib.closing`) when stopping early.
+    """
+    stats = stats or Stats()
+
+    with ExitStack() as stack:
+        with stats.stage("decompress"):
+            temp_dir = stack.enter_context(temp_extract_dir(input_zip_file))
+
+        # Find the .shp file in the extracted contents
+        shp_file = next(temp_dir.rglob("*.shp"), None)
+
+        if not shp_file:
+            raise FileNotFoundError("No .shp file found in the zip archive")
+
+        if not Path(str(shp_file).replace(".shp", ".shx")).exists():
+            raise FileNotFoundError("No .shx file found in the zip archive")
+
+        if not Path(str(shp_file).replace(".shp", ".dbf")).exists():
+            raise FileNotFoundError("No .dbf file found in the zip archive")
+
+        source = stack.enter_context(fiona.open(shp_file, "r"))
+        records = iter(source)
+        while True:
+            with stats.stage("parse"):
+                feature = next(records, None)
+                plain_feature = to_dict(feature) if feature is not None else None
+
+            if plain_feature is None:
+                break
+
+            stats.count("features")
+            stats.count("vertices", count_vertices(plain_feature["geometry"]))
+            yield plain_feature
@@ -2,10 +2,18 @@
 import gzip
 import json
 import os
+import sys
 import tempfile
 import zipfile
+from pathlib import Path
 import click
-from shapely.geometry import shape
+
+if __name__ == "__main__" and not __package__:
+    # Run as a script (`python src/split_by_states.py`): make the relative imports resolve against the `src` package.
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    __package__ = "src"  # pylint: disable=redefined-builtin
+
+from .instrumentation import Stats, instrumented
 
 
 def _load_geojson(filepath):
@@ -39,36 +47,6 @@ def _load_gzip_geojson(filepath):
         return json.load(gz_file)
 
 
-def _extract_state_geometries(states_data, state_name_field):
-    """Extract state geometries from the state GeoJSON data."""
-    state_geometries = {}
-    for state_feature in states_data["features"]:
-        if state_feature["geometry"] is None:
-            continue
-        try:
-            state_name = state_feature["properties"][state_name_field]
-        except KeyError as exc:
-            raise KeyError(f"`{state_name_field}` not found in properties: {state_feature['properties'].keys()}") from exc
-        state_geometries[state_name] = shape(state_feature["geometry"])
-    return state_geometries
-
-
-def _assign_features_to_states(input_data, state_geometries):
-    """Assign input features to states based on intersection."""
-    state_features = {}
-
-    for feature in input_data["features"]:
-        feature_geom = shape(feature["geometry"])
-
-        for state_name, state_geom in state_geometries.items():
-            intersection = state_geom.intersection(feature_geom)
-
-            if not intersection.is_empty:
-                state_features.setdefault(state_name, []).append(feature)
-
-    return state_features
-
-
 def _write_features_to_files(output_dir, state_features, original_filename):
     """Write features for each state to separate GeoJSON files."""
 
@@ -82,7 +60,7 @@ def _write_features_to_files(output_dir, state_features, original_filename):
         click.echo(f"Output: {output_path}. {len(features)} features saved for {state_name}")
 
 
-def split_geojson_by_state(states_geojson_path, input_geojson_path, output_dir, state_name_field):
+def split_geojson_by_state(states_geojson_path, input_geojson_path, output_dir, state_name_field, stats=None):
     """
     Splits a GeoJSON file into multiple files based on the state boundaries defined in another GeoJSON.
 
@@ -91,16 +69,25 @@ def split_geojson_by_state(states_geojson_path, input_geojson_path, output_dir,
         input_geojson_path: Path to the GeoJSON file to be split.
         output_dir: Directory to save the split GeoJSON files.
         state_name_field: The name of the field in the state GeoJSON properties containing the state name.
+        stats: Optional `Stats` to record timers and counters into.
     """
+    from shapely import get_num_coordinates  # pylint: disable=import-outside-toplevel
+    from .api import Boundaries, split_features  # pylint: disable=import-outside-toplevel
+
+    stats = stats or Stats()
     original_filename = os.path.basename(input_geojson_path).rsplit(".", 1)[0]
 
-    states_data = _load_geojson(states_geojson_path)
-    input_data = _load_geojson(input_geojson_path)
+    with stats.stage("parse"):
+        states_data = _load_geojson(states_geojson_path)
+        input_data = _load_geojson(input_geojson_path)
 
     os.makedirs(output_dir, exist_ok=True)
-    state_geometries = _extract_state_geometries(states_data, state_name_field)
-    state_features = _assign_features_to_states(input_data, state_geometries)
-    _write_features_to_files(output_dir, state_features, original_filename)
+    with stats.stage("geometry"):
+        boundaries = Boundaries.from_features(states_data["features"], state_name_field)
+    stats.count("state_vertices", int(get_num_coordinates(boundaries.geometries).sum()))
+    state_features = split_features(input_data["features"], boundaries, stats)
+    with stats.stage("serialization"):
+        _write_features_to_files(output_dir, state_features, original_filename)
 
 
 @click.command()
@@ -108,11 +95,12 @@ def split_geojson_by_state(states_geojson_path, input_geojson_path, output_dir,
 @click.argument("input_geojson_path", type=click.Path(exists=True))
 @click.argument("output_dir", type=click.Path())
 @click.argument("state_name_field", type=click.STRING)
-def main(states_geojson_path, input_geojson_path, output_dir, state_name_field):
+@instrumented
+def main(states_geojson_path, input_geojson_path, output_dir, state_name_field, stats):
     """
     Splits a GeoJSON file into multiple files based on state boundaries.
     """
-    split_geojson_by_state(states_geojson_path, input_geojson_path, output_dir, state_name_field)
+    split_geojson_by_state(states_geojson_path, input_geojson_path, output_dir, state_name_field, stats)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,136 @@
+import subprocess
+import sys
+from copy import deepcopy
+from pathlib import Path
+import pytest
+import shapely
+from shapely.geometry import LineString, MultiPolygon, Point, Polygon
+from ..api import Boundaries, simplify_features, simplify_geometries, simplify_geometry, split_features
+from ..instrumentation import Stats
+from .test_split_geojson_by_state import INPUT_DATA, STATES_DATA
+
+ZIGZAG = Polygon([(1, 1), (1, 2), (1.5, 1.5), (2, 2), (2, 1), (1, 1)])
+
+
+@pytest.fixture(name="boundaries")
+def fixture_boundaries():
+    return Boundaries.from_features(STATES_DATA["features"], "STATE_NAME")
+
+
+def test_boundaries_from_features(boundaries):
+    assert len(boundaries) == 2
+    assert boundaries.names == ["California", "Nevada"]
+
+
+def test_boundaries_name_field_not_found():
+    with pytest.raises(KeyError) as exc:
+        Boundaries.from_features(STATES_DATA["features"], "NAME")
+    assert "`NAME` not found in properties" in str(exc.value)
+
+
+def test_boundaries_query(boundaries):
+    """Pairs are sorted by geometry and boundary, and geometries outside every boundary are left out."""
+    stats = Stats()
+    pairs = boundaries.query([Point(0, 0), Point(-119.9, 39.5), Point(-121, 37)], stats)
+
+    assert pairs.tolist() == [[1, 1, 2], [0, 1, 0]]
+    assert stats.counters["hits"] == 3
+    assert stats.counters["candidates"] >= 3
+
+
+def test_split_features(boundaries):
+    """Features are grouped per boundary, in input order, and can come from a generator."""
+    features = deepcopy(INPUT_DATA["features"]) + [{"type": "Feature", "properties": {"id": "none"}, "geometry": None}]
+
+    result = split_features((feature for feature in features), boundaries)
+
+    assert list(result) == ["California", "Nevada"]
+    assert [feature["properties"]["id"] for feature in result["California"]] == ["1", "3"]
+    assert [feature["properties"]["id"] for feature in result["Nevada"]] == ["2", "3"]
+
+
+def test_split_features_reuses_boundaries(boundaries):
+    """The same boundaries can be used for several splits."""
+    first = split_features(INPUT_DATA["features"][:1], boundaries)
+    second = split_features(INPUT_DATA["features"][1:2], boundaries)
+
+    assert list(first) == ["California"]
+    assert list(second) == ["Nevada"]
+
+
+def test_simplify_geometry():
+    simplified, points_before, points_after = simplify_geometry(ZIGZAG, 1)
+
+    assert points_before == 6
+    assert points_after < points_before
+    assert simplified.geom_type == "Polygon"
+    assert simplify_geometry(Point(0, 0), 1) is None
+
+
+def test_simplify_geometries():
+    """Only polygonal geometries are simplified."""
+    line = LineString([(0, 0), (1, 0.01), (2, 0)])
+
+    result = simplify_geometries([ZIGZAG, line, None], 1)
+
+    assert shapely.get_num_coordinates(result[0]) < shapely.get_num_coordinates(ZIGZAG)
+    assert result[1].equals(line)
+    assert result[2] is None
+
+
+def test_simplify_geometry_matches_simplify_geometries():
+    """A MultiPolygon is simplified as a whole, so a part sitting in the notch of another does not end up overlapping it."""
+    u_shape = Polygon([(0, 0), (3, 0), (3, 3), (2, 3), (2, 1), (1, 1), (0.5, 2), (1, 3), (0, 3)])
+    in_notch = Polygon([(0.8, 1.8), (1.4, 1.8), (1.4, 2.2), (0.8, 2.2)])
+    multipolygon = MultiPolygon([u_shape, in_notch])
+
+    simplified, _, _ = simplify_geometry(multipolygon, 0.6)
+
+    assert simplified.is_valid
+    assert simplified.equals(simplify_geometries([multipolygon], 0.6)[0])
+
+
+def test_simplify_features():
+    features = [
+        {"type": "Feature", "properties": {}, "geometry": shapely.geometry.mapping(ZIGZAG)},
+        {"type": "Feature", "properties": {}, "geometry": None},
+    ]
+    stats = Stats()
+    simplified = []
+
+    result = list(simplify_features(features, 1, stats, on_simplified=lambda *args: simplified.append(args)))
+
+    assert simplified == [(0, 6, 4)]
+    assert len(result) == 2
+    assert len(result[0]["geometry"]["coordinates"][0]) < 6
+    assert result[1]["geometry"] is None
+    assert stats.counters["features"] == 2
+    assert stats.counters["vertices"] == 6
+
+
+def test_cli_modules_import_lazily():
+    """Importing the commands does not load fiona or shapely."""
+    code = "import sys, src.shp2geojson, src.geojson_simplify, src.split_by_states; print('fiona' in sys.modules or 'shapely' in sys.modules)"
+
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=Path(__file__).parents[2])
+
+    assert result.stdout.strip() == "False"
+
+
+def test_package_exports_api():
+    """The API is available from the package root."""
+    import src  # pylint: disable=import-outside-toplevel
+
+    assert src.split_features is split_features
+    assert src.Boundaries is Boundaries
+
+
+def test_simplify_features_counts_all_coordinates():
+    """The vertex counters include the interior rings, like the other commands."""
+    with_hole = Polygon([(0, 0), (10, 0), (10, 10), (0, 10)], [[(4, 4), (6, 4), (6, 6), (4, 6)]])
+    stats = Stats()
+
+    list(simplify_features([{"type": "Feature", "properties": {}, "geometry": shapely.geometry.mapping(with_hole)}], 0.1, stats))
+
+    assert stats.counters["vertices"] == 10
+    assert stats.counters["vertices_simplified"] == 10
@@ -0,0 +1,98 @@
+import json
+import zipfile
+import fiona
+import pytest
+from shapely.geometry import shape
+from shapely.ops import unary_union
+from ..benchmarks.datasets import DEFAULT_BOUNDS, generate_boundary_coverage, generate_detailed_polygons, generate_point_cloud, generate_zipped_shapefile
+from ..benchmarks.run import compare_results, run_case, simplify_vertices
+
+
+def _load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_generate_point_cloud_is_reproducible(tmp_path):
+    """The same seed produces the same points."""
+    first = tmp_path / "first.geojson"
+    second = tmp_path / "second.geojson"
+
+    assert generate_point_cloud(first, 100, seed=1) == 100
+    generate_point_cloud(second, 100, seed=1)
+
+    assert first.read_text(encoding="utf-8") == second.read_text(encoding="utf-8")
+    assert len(_load(first)["features"]) == 100
+
+
+def test_generate_detailed_polygons(tmp_path):
+    """Polygons are valid and have the requested level of detail."""
+    output = tmp_path / "polygons.geojson"
+    generate_detailed_polygons(output, 8, vertices=40)
+
+    features = _load(output)["features"]
+    assert len(features) == 8
+    assert {feature["geometry"]["type"] for feature in features} == {"Polygon", "MultiPolygon"}
+    assert len(features[0]["geometry"]["coordinates"][0]) == 41
+    assert all(shape(feature["geometry"]).is_valid for feature in features)
+
+
+@pytest.mark.parametrize("regions", [1, 50, 77])
+def test_generate_boundary_coverage_tiles_bounds(tmp_path, regions):
+    """The coverage has exactly the requested number of regions and covers the bounds without overlaps."""
+    output = tmp_path / "coverage.geojson"
+    generate_boundary_coverage(output, regions=regions, vertices_per_edge=3)
+
+    geometries = [shape(feature["geometry"]) for feature in _load(output)["features"]]
+    min_x, min_y, max_x, max_y = DEFAULT_BOUNDS
+
+    assert len(geometries) == regions
+    assert sum(geometry.area for geometry in geometries) == pytest.approx((max_x - min_x) * (max_y - min_y))
+    assert unary_union(geometries).area == pytest.approx((max_x - min_x) * (max_y - min_y))
+
+
+def test_generate_zipped_shapefile(tmp_path):
+    """The zip contains a readable shapefile."""
+    output = tmp_path / "points.zip"
+    generate_zipped_shapefile(output, 25)
+
+    with zipfile.ZipFile(output) as zip_ref:
+        assert {"points.shp", "points.shx", "points.dbf"} <= set(zip_ref.namelist())
+
+    with fiona.open(f"zip://{output}!points.shp") as source:
+        assert len(source) == 25
+
+
+def test_run_case(tmp_path):
+    """A case reports timings and memory for the generated dataset."""
+    result = run_case("split_geojson_by_state", 20, tmp_path, regions=4)
+
+    assert result["case"] == "split_geojson_by_state"
+    assert result["features"] == 20
+    assert result["regions"] == 4
+    assert result["wall_time_s"] > 0
+    assert result["peak_rss_mb"] > 0
+
+
+def test_compare_results():
+    """Only metrics worse than the threshold are reported."""
+    baseline = {"results": [{"case": "geojson_simplify", "features": 10, "wall_time_s": 1.0, "peak_rss_mb": 100}]}
+    results = {
+        "results": [
+            {"case": "geojson_simplify", "features": 10, "wall_time_s": 1.5, "peak_rss_mb": 110},
+            {"case": "shapefile_to_geojson", "features": 10, "wall_time_s": 9.0, "peak_rss_mb": 900},
+        ]
+    }
+
+    regressions = compare_results(results, baseline, threshold=0.2)
+
+    assert len(regressions) == 1
+    assert "wall_time_s" in regressions[0]
+    assert not compare_results(results, baseline, threshold=0.6)
+
+
+def test_simplify_vertices_scale_down():
+    """The simplify dataset gets simpler polygons at the larger scales, but never degenerate MultiPolygon parts."""
+    assert simplify_vertices(10_000) == 64
+    assert simplify_vertices(1_000_000) == 16
+    assert simplify_vertices(10_000_000) == 8
@@ -0,0 +1,111 @@
+import json
+import pstats
+import subprocess
+import sys
+from pathlib import Path
+import click
+import pytest
+from click.testing import CliRunner
+from shapely import get_num_coordinates
+from shapely.geometry import shape
+from ..instrumentation import Stats, count_vertices, instrumented
+from ..split_by_states import main as split_by_states_main
+from .test_split_geojson_by_state import INPUT_DATA, STATES_DATA
+
+
+@click.command()
+@click.argument("value", type=int)
+@instrumented
+def _sample_command(value, stats):
+    with stats.stage("work"):
+        stats.count("features", value)
+        stats.count("candidates", 4)
+        stats.count("hits")
+
+
+def test_stats_report():
+    """Stages accumulate and the derived metrics are computed from the counters."""
+    stats = Stats()
+    for _ in range(3):
+        with stats.stage("parse"):
+            stats.count("features")
+    stats.count("candidates", 10)
+    stats.count("hits", 2)
+
+    report = stats.report()
+
+    assert set(report["stages"]) == {"parse"}
+    assert report["counters"] == {"features": 3, "candidates": 10, "hits": 2}
+    assert report["hit_ratio"] == pytest.approx(0.2)
+    assert report["features_per_s"] > 0
+    assert report["peak_rss_mb"] > 0
+
+
+@pytest.mark.parametrize(
+    "geometry, expected",
+    [
+        (None, 0),
+        ({"type": "Point", "coordinates": [1, 2]}, 1),
+        ({"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]]}, 4),
+        ({"type": "GeometryCollection", "geometries": [{"type": "Point", "coordinates": [1, 2]}, {"type": "LineString", "coordinates": [[0, 0], [1, 1]]}]}, 3),
+    ],
+)
+def test_count_vertices(geometry, expected):
+    assert count_vertices(geometry) == expected
+
+
+def test_instrumented_stats_json():
+    """`--stats json` prints a machine-readable report to stderr."""
+    result = CliRunner().invoke(_sample_command, ["5", "--stats", "json"])
+
+    assert result.exit_code == 0, result.output
+    report = json.loads(result.stderr)
+    assert report["counters"]["features"] == 5
+    assert report["hit_ratio"] == pytest.approx(0.25)
+    assert "work" in report["stages"]
+
+
+def test_instrumented_without_stats():
+    """No report is printed unless requested."""
+    result = CliRunner().invoke(_sample_command, ["5"])
+
+    assert result.exit_code == 0
+    assert not result.stderr
+
+
+def test_instrumented_profile(tmp_path):
+    """`--profile` writes a cProfile dump."""
+    profile_path = tmp_path / "run.prof"
+    result = CliRunner().invoke(_sample_command, ["5", "--profile", str(profile_path)])
+
+    assert result.exit_code == 0
+    assert pstats.Stats(str(profile_path)).total_calls > 0
+
+
+def test_split_by_states_stats(tmp_path):
+    """The split command reports the candidate and hit counts of the spatial tests."""
+    states_path = tmp_path / "states.json"
+    input_path = tmp_path / "input.json"
+    states_path.write_text(json.dumps(STATES_DATA), encoding="utf-8")
+    input_path.write_text(json.dumps(INPUT_DATA), encoding="utf-8")
+
+    result = CliRunner().invoke(split_by_states_main, [str(states_path), str(input_path), str(tmp_path / "out"), "STATE_NAME", "--stats", "json"])
+
+    assert result.exit_code == 0, result.output
+    report = json.loads(result.stderr)
+    assert report["counters"]["features"] == len(INPUT_DATA["features"])
+    assert report["counters"]["hits"] == 4
+    assert report["counters"]["state_vertices"] == sum(get_num_coordinates(shape(feature["geometry"])) for feature in STATES_DATA["features"])
+    assert report["counters"]["hits"] <= report["counters"]["candidates"] <= len(INPUT_DATA["features"]) * len(STATES_DATA["features"])
+    assert {"parse", "geometry", "predicates", "serialization"} <= set(report["stages"])
+
+
+@pytest.mark.parametrize("script", ["shp2geojson.py", "geojson_simplify.py", "split_by_states.py"])
+def test_commands_run_as_scripts(script, tmp_path):
+    """The commands can still be executed directly, from any working directory."""
+    script_path = Path(__file__).parents[1] / script
+
+    result = subprocess.run([sys.executable, str(script_path), "--help"], capture_output=True, text=True, check=False, cwd=tmp_path)
+
+    assert result.returncode == 0, result.stderr
+    assert "--stats" in result.stdout
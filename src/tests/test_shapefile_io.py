@@ -0,0 +1,32 @@
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+import fiona
+from ..shapefile_io import read_shapefile
+
+
+def test_read_shapefile(tmp_path):
+    schema = {"geometry": "Point", "properties": {"id": "int"}}
+    with fiona.open(tmp_path / "sample.shp", "w", driver="ESRI Shapefile", crs="EPSG:4326", schema=schema) as shapefile:
+        shapefile.write({"geometry": {"type": "Point", "coordinates": (10, 10)}, "properties": {"id": 1}})
+
+    zip_path = tmp_path / "sample.zip"
+    with zipfile.ZipFile(zip_path, "w") as zipf:
+        for ext in ("shp", "shx", "dbf", "prj"):
+            zipf.write(tmp_path / f"sample.{ext}", f"sample.{ext}")
+
+    features = list(read_shapefile(zip_path))
+
+    assert len(features) == 1
+    assert features[0]["geometry"]["coordinates"] == (10.0, 10.0)
+    assert features[0]["properties"]["id"] == 1
+
+
+def test_shapefile_io_does_not_load_shapely():
+    """Converting shapefiles only needs fiona, so shp2geojson does not pay for numpy and shapely."""
+    code = "import sys, src.shapefile_io; print('shapely' in sys.modules or 'numpy' in sys.modules)"
+
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=Path(__file__).parents[2])
+
+    assert result.stdout.strip() == "False"